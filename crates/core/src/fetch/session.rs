@@ -323,12 +323,7 @@ impl Session {
     pub fn find_by_role(&self, role: &str) -> Vec<&SpatialElement> {
         self.current_dom
             .as_ref()
-            .map(|dom| {
-                dom.els
-                    .iter()
-                    .filter(|e| e.role.as_deref() == Some(role))
-                    .collect()
-            })
+            .map(|dom| dom.find_by_role(role))
             .unwrap_or_default()
     }
 
@@ -490,18 +485,41 @@ impl Session {
         self.current_url.as_ref().map(|u| u.as_str())
     }
 
+    /// Drop the loaded page, history, and form state. Cookies, config, and
+    /// learned domain memory are kept, so this is much cheaper than building
+    /// a new session.
+    pub fn reset(&mut self) {
+        self.current_url = None;
+        self.current_dom = None;
+        self.previous_dom = None;
+        self.history.clear();
+        self.form_values.clear();
+        self.checked_ids.clear();
+        self.unchecked_ids.clear();
+        self.current_html = None;
+    }
+
     // --- Findability methods ---
 
     /// Case-insensitive substring match on element text.
     pub fn find_by_text_fuzzy(&self, text: &str) -> Vec<&SpatialElement> {
         let needle = text.to_lowercase();
+        let ascii_needle = needle.is_ascii();
         self.current_dom
             .as_ref()
             .map(|dom| {
                 dom.els
                     .iter()
                     .filter(|e| {
-                        e.text.as_ref().map(|t| t.to_lowercase().contains(&needle)).unwrap_or(false)
+                        e.text.as_deref().map(|t| {
+                            // ASCII text compares in place; anything else needs full
+                            // Unicode lowercasing (e.g. U+212A KELVIN SIGN -> 'k').
+                            if ascii_needle && t.is_ascii() {
+                                contains_ascii_ci(t, &needle)
+                            } else {
+                                t.to_lowercase().contains(&needle)
+                            }
+                        }).unwrap_or(false)
                     })
                     .collect()
             })
@@ -963,6 +981,14 @@ impl Session {
     }
 }
 
+/// ASCII case-insensitive substring test without allocating. `needle` must
+/// already be lowercase.
+fn contains_ascii_ci(haystack: &str, needle: &str) -> bool {
+    let needle = needle.as_bytes();
+    needle.is_empty()
+        || haystack.as_bytes().windows(needle.len()).any(|w| w.eq_ignore_ascii_case(needle))
+}
+
 fn retry_delay_ms(base_ms: u64, attempt: usize, retry_after_secs: Option<u64>) -> u64 {
     let base = base_ms.max(50);
     let exp = 1u64 << attempt.min(6);
@@ -23,6 +23,19 @@ pub struct SpatialDom {
     /// O(1) lookup: element ID → index in `els`.
     #[serde(skip)]
     id_index: HashMap<u32, usize>,
+    /// ARIA role → indices in `els`, in document order.
+    #[serde(skip)]
+    role_index: HashMap<String, Vec<usize>>,
+}
+
+fn build_role_index(els: &[SpatialElement]) -> HashMap<String, Vec<usize>> {
+    let mut index: HashMap<String, Vec<usize>> = HashMap::new();
+    for (i, e) in els.iter().enumerate() {
+        if let Some(role) = &e.role {
+            index.entry(role.clone()).or_default().push(i);
+        }
+    }
+    index
 }
 
 /// CAPTCHA information detected on the page.
@@ -230,9 +243,18 @@ impl SpatialDom {
         self.id_index.get(&id).map(|&idx| &self.els[idx])
     }
 
-    /// Rebuild the ID index (call after mutating `els`).
+    /// Elements with the given ARIA role, in document order.
+    pub fn find_by_role(&self, role: &str) -> Vec<&SpatialElement> {
+        self.role_index
+            .get(role)
+            .map(|idx| idx.iter().map(|&i| &self.els[i]).collect())
+            .unwrap_or_default()
+    }
+
+    /// Rebuild the ID and role indexes (call after mutating `els`).
     pub fn rebuild_index(&mut self) {
         self.id_index = self.els.iter().enumerate().map(|(i, e)| (e.id, i)).collect();
+        self.role_index = build_role_index(&self.els);
     }
 
     /// Return only visible (non-hidden) elements.
@@ -257,6 +279,7 @@ impl SpatialDom {
         let fold_y = self.vp[1] as i32;
         let els: Vec<SpatialElement> = self.els.iter().filter(|e| e.b[1] < fold_y).cloned().collect();
         let id_index = els.iter().enumerate().map(|(i, e)| (e.id, i)).collect();
+        let role_index = build_role_index(&els);
         SpatialDom {
             url: self.url.clone(),
             title: self.title.clone(),
@@ -268,6 +291,7 @@ impl SpatialDom {
             blocked: self.blocked.clone(),
             els,
             id_index,
+            role_index,
         }
     }
 }
@@ -311,6 +335,7 @@ pub fn generate_spatial_dom(
     let captcha = detect_captcha_from_tree(root);
 
     let id_index = els.iter().enumerate().map(|(i, e)| (e.id, i)).collect();
+    let role_index = build_role_index(&els);
     let mut dom = SpatialDom {
         url: String::new(), // Set by caller
         title,
@@ -322,6 +347,7 @@ pub fn generate_spatial_dom(
         blocked: None,
         els,
         id_index,
+        role_index,
     };
 
     // Detect page type and suggested actions
@@ -1232,49 +1258,51 @@ impl SpatialDom {
             "enter code", "otp", "passcode", "one-time",
         ];
 
-        let mut codes = Vec::new();
+        // Lowercase each element's text once; the proximity check reuses
+        // these flags instead of re-lowercasing every element per candidate.
+        let keyword_flags: Vec<bool> = self.els.iter().map(|el| {
+            el.text.as_ref().map(|t| {
+                let lower = t.to_lowercase();
+                code_keywords.iter().any(|kw| lower.contains(kw))
+            }).unwrap_or(false)
+        }).collect();
 
-        for el in &self.els {
+        // Y positions of short keyword labels, for the proximity check.
+        let label_ys: Vec<i32> = self.els.iter().zip(&keyword_flags)
+            .filter(|(el, kw)| **kw && el.text.as_ref().map(|t| t.len() < 80).unwrap_or(false))
+            .map(|(el, _)| el.b[1])
+            .collect();
+
+        let mut codes: Vec<String> = Vec::new();
+
+        for (el, &has_keyword) in self.els.iter().zip(&keyword_flags) {
             let text = match &el.text {
                 Some(t) => t,
                 None => continue,
             };
 
-            let text_lower = text.to_lowercase();
-            let has_keyword = code_keywords.iter().any(|kw| text_lower.contains(kw));
-
             // Proximity check: only match short label elements within 100px Y
-            let near_keyword = if !has_keyword {
+            if !has_keyword {
                 let el_y = el.b[1];
-                self.els.iter().any(|other| {
-                    (other.b[1] - el_y).abs() < 100
-                        && other.text.as_ref().map(|t| {
-                            t.len() < 80 && {
-                                let lower = t.to_lowercase();
-                                code_keywords.iter().any(|kw| lower.contains(kw))
-                            }
-                        }).unwrap_or(false)
-                })
-            } else {
-                false
-            };
-
-            if !has_keyword && !near_keyword {
-                continue;
+                if !label_ys.iter().any(|&y| (y - el_y).abs() < 100) {
+                    continue;
+                }
             }
 
-            // Extract 4-8 digit sequences, filtering out year-like numbers
-            let chars: Vec<char> = text.chars().collect();
+            // Extract 4-8 digit sequences, filtering out year-like numbers.
+            // ASCII digits never appear inside multi-byte UTF-8 sequences, so
+            // scanning bytes finds exactly the same runs as scanning chars.
+            let bytes = text.as_bytes();
             let mut i = 0;
-            while i < chars.len() {
-                if chars[i].is_ascii_digit() {
+            while i < bytes.len() {
+                if bytes[i].is_ascii_digit() {
                     let start = i;
-                    while i < chars.len() && chars[i].is_ascii_digit() {
+                    while i < bytes.len() && bytes[i].is_ascii_digit() {
                         i += 1;
                     }
                     let len = i - start;
                     if len >= 4 && len <= 8 {
-                        let code: String = chars[start..i].iter().collect();
+                        let code = &text[start..i];
                         // Filter out year-like 4-digit numbers (1900-2099)
                         if len == 4 {
                             if let Ok(n) = code.parse::<u32>() {
@@ -1283,8 +1311,8 @@ impl SpatialDom {
                                 }
                             }
                         }
-                        if !codes.contains(&code) {
-                            codes.push(code);
+                        if !codes.iter().any(|c| c == code) {
+                            codes.push(code.to_string());
                         }
                     }
                 } else {
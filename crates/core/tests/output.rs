@@ -1053,6 +1053,20 @@ fn test_find_codes_no_false_positives() {
     assert!(codes.is_empty(), "Should not find codes without keyword context, got: {:?}", codes);
 }
 
+#[test]
+fn test_find_codes_near_label_with_unicode() {
+    let html = r#"
+    <html><body>
+        <p>Your code:</p>
+        <p>Código — 5821 (válido até 2024)</p>
+    </body></html>
+    "#;
+
+    let dom = browsy_core::parse(html, 1920.0, 1080.0);
+    let codes = dom.find_codes();
+    assert_eq!(codes, vec!["5821".to_string()], "Should find the code next to the label, got: {:?}", codes);
+}
+
 #[test]
 fn test_consent_action_detection() {
     let html = r#"
@@ -1074,3 +1088,28 @@ fn test_consent_action_detection() {
         assert!(!deny_ids.is_empty(), "Should have deny buttons");
     }
 }
+
+#[test]
+fn test_find_by_role_index() {
+    let html = r#"
+    <html><body>
+        <button>Save</button>
+        <a href="/a">A</a>
+        <button hidden>Hidden</button>
+        <a href="/b">B</a>
+    </body></html>
+    "#;
+
+    let mut dom = browsy_core::parse(html, 1920.0, 1080.0);
+    let scan: Vec<u32> = dom.els.iter().filter(|e| e.role.as_deref() == Some("link")).map(|e| e.id).collect();
+    let indexed: Vec<u32> = dom.find_by_role("link").iter().map(|e| e.id).collect();
+    assert_eq!(indexed, scan);
+    assert!(dom.find_by_role("no-such-role").is_empty());
+
+    // The index must follow `els` after a rebuild.
+    dom.els.retain(|e| e.hidden != Some(true));
+    dom.rebuild_index();
+    let buttons = dom.find_by_role("button");
+    assert!(buttons.iter().all(|e| e.hidden != Some(true)));
+    assert_eq!(buttons.len(), dom.els.iter().filter(|e| e.role.as_deref() == Some("button")).count());
+}
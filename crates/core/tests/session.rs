@@ -70,6 +70,10 @@ fn test_session_find_helpers() {
     assert_eq!(session.find_by_role("link").len(), 1);
     assert_eq!(session.find_by_role("textbox").len(), 1);
 
+    assert_eq!(session.find_by_text_fuzzy("SAVE").len(), 1);
+    assert_eq!(session.find_by_text_fuzzy("board").len(), 1);
+    assert_eq!(session.find_by_text_fuzzy("").len(), session.find_by_text("").len());
+
     let first_id = session.dom().unwrap().els[0].id;
     assert!(session.element(first_id).is_some());
 }
@@ -641,3 +645,30 @@ fn test_find_input_by_purpose() {
     assert!(phone.is_some());
     assert_eq!(phone.unwrap().input_type.as_deref(), Some("tel"));
 }
+
+#[test]
+#[cfg(feature = "fetch")]
+fn test_session_reset() {
+    let mut session = Session::new().unwrap();
+
+    session.load_html(
+        r#"<html><body><input type="text" name="q" /><button>Go</button></body></html>"#,
+        "http://localhost/form",
+    ).unwrap();
+    let input_id = session.find_by_role("textbox")[0].id;
+    session.type_text(input_id, "hello").unwrap();
+
+    session.reset();
+    assert!(session.dom().is_none());
+    assert!(session.delta().is_none());
+    assert!(session.url().is_none());
+    assert!(session.back().is_err());
+
+    // The session is still usable after a reset, with no stale form state.
+    session.load_html(
+        r#"<html><body><input type="text" name="q" /><button>Go</button></body></html>"#,
+        "http://localhost/form",
+    ).unwrap();
+    let dom = session.dom().unwrap();
+    assert!(dom.els.iter().all(|e| e.val.as_deref() != Some("hello")));
+}
@@ -1,9 +1,19 @@
 """Shared utilities for browsy framework integrations."""
 
+import os
+import threading
+from itertools import chain
+
 from browsy import Browser
 
-# Module-level default browser (lazy-initialized)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Module-level default browser (lazy-initialized, guarded by _default_lock)
 _default_browser = None
+_default_lock = threading.Lock()
 
 
 def get_browser(browser=None):
@@ -11,30 +21,168 @@ def get_browser(browser=None):
     global _default_browser
     if browser is not None:
         return browser
-    if _default_browser is None:
-        _default_browser = Browser()
-    return _default_browser
+    if _default_browser is not None:
+        return _default_browser
+    with _default_lock:
+        if _default_browser is None:
+            _default_browser = Browser()
+        return _default_browser
+
+
+def reset_default_browser():
+    """Drop the shared default browser so the next get_browser() builds a new one."""
+    global _default_browser
+    with _default_lock:
+        _default_browser = None
+
+
+def _reinit_after_fork():
+    # Only the forking thread survives in the child, so the lock may be held
+    # by a thread that no longer exists; replace it rather than acquire it.
+    global _default_browser, _default_lock
+    _default_lock = threading.Lock()
+    _default_browser = None
+
+
+# A forked child must not share the parent's browser session.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
+
+# Function-calling descriptions, shared by the OpenAI and AutoGen integrations.
+TOOL_DESCRIPTIONS = {
+    "browsy_browse": (
+        "Navigate to a URL and return page content with page intelligence. "
+        "Returns page type (Login, Search, Form, etc.), suggested actions "
+        "with element IDs, and all interactive elements."
+    ),
+    "browsy_click": "Click an element by its ID. Links navigate, buttons submit forms.",
+    "browsy_type_text": "Type text into an input field or textarea by element ID.",
+    "browsy_search": "Search the web and return results with title, URL, and snippet.",
+    "browsy_login": "Log in using detected login form fields on the current page.",
+    "browsy_page_info": "Get current page metadata: type, suggested actions, alerts.",
+}
+
+
+def load_arguments(arguments):
+    """Return tool-call arguments as a dict, decoding them if given as JSON.
+
+    The OpenAI SDK hands arguments over as a JSON string; orjson is used to
+    decode it when installed.
+    """
+    if isinstance(arguments, (str, bytes)):
+        return _json_loads(arguments)
+    return arguments
+
+
+def format_page_info(page):
+    """Format a Page's metadata (title, url, type, suggested actions)."""
+    header = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type()}"
+    actions = page.suggested_actions()
+    if not actions:
+        return header
+    return "\n".join((header, "suggested_actions:", *(f"  {a}" for a in actions)))
 
 
 def format_page(page):
     """Format a Page into a compact string with page intelligence."""
-    result = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type}\n"
-    actions = page.suggested_actions()
-    if actions:
-        result += "suggested_actions:\n"
-        for a in actions:
-            result += f"  {a}\n"
-    result += f"---\n{page.to_compact()}"
-    return result
+    return f"{format_page_info(page)}\n---\n{page.to_compact()}"
 
 
 def format_search_results(results):
     """Format search results into a readable string."""
-    lines = []
-    for i, r in enumerate(results, 1):
-        lines.append(f"{i}. {r['title']}")
-        lines.append(f"   {r['url']}")
-        if r.get("snippet"):
-            lines.append(f"   {r['snippet']}")
-        lines.append("")
-    return "\n".join(lines) if lines else "No results found."
+    if not results:
+        return "No results found."
+    return "\n".join(chain.from_iterable(_result_lines(i, r) for i, r in enumerate(results, 1)))
+
+
+def _result_lines(i, r):
+    if r.get("snippet"):
+        return (f"{i}. {r['title']}", f"   {r['url']}", f"   {r['snippet']}", "")
+    return (f"{i}. {r['title']}", f"   {r['url']}", "")
+
+
+# --- Text command dispatch (shared by single-tool integrations) ---
+
+
+def _parse_element_id(raw):
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def _cmd_browse(browser, parts):
+    return format_page(browser.goto(parts[1]))
+
+
+def _cmd_click(browser, parts):
+    element_id = _parse_element_id(parts[1])
+    if element_id is None:
+        return f"Error: invalid element ID '{parts[1]}'"
+    return format_page(browser.click(element_id))
+
+
+def _cmd_type(browser, parts):
+    element_id = _parse_element_id(parts[1])
+    if element_id is None:
+        return f"Error: invalid element ID '{parts[1]}'"
+    browser.type_text(element_id, parts[2])
+    return f"Typed '{parts[2]}' into element {element_id}"
+
+
+def _cmd_search(browser, parts):
+    return format_search_results(browser.search(" ".join(parts[1:])))
+
+
+def _cmd_login(browser, parts):
+    return format_page(browser.login(parts[1], parts[2]))
+
+
+def _cmd_info(browser, parts):
+    page = browser.dom()
+    if page is None:
+        return "No page loaded. Use 'browse <url>' first."
+    return format_page_info(page)
+
+
+def _cmd_back(browser, parts):
+    return format_page(browser.back())
+
+
+# verb -> (handler, minimum number of parts including the verb)
+_COMMANDS = {
+    "browse": (_cmd_browse, 2),
+    "click": (_cmd_click, 2),
+    "type": (_cmd_type, 3),
+    "search": (_cmd_search, 2),
+    "login": (_cmd_login, 3),
+    "info": (_cmd_info, 1),
+    "back": (_cmd_back, 1),
+}
+
+
+def run_command(browser, command):
+    """Run a text command such as ``browse <url>`` and return the result string."""
+    command = command.strip()
+    entry = _COMMANDS.get(command)
+    if entry is not None and entry[1] == 1:
+        # Bare argument-less verb ("info", "back"): skip splitting and lowercasing.
+        return entry[0](browser, (command,))
+
+    parts = command.split(None, 2)
+    if not parts:
+        return "Error: empty command. Use 'browse <url>', 'click <id>', etc."
+
+    action = parts[0]
+    if action not in _COMMANDS:
+        # Agents almost always send lowercase verbs; only pay for .lower() otherwise.
+        action = action.lower()
+    entry = _COMMANDS.get(action)
+    if entry is None or len(parts) < entry[1]:
+        return (
+            f"Unknown command '{action}'. Available: "
+            "browse, click, type, search, login, info, back"
+        )
+    handler, _ = entry
+    return handler(browser, parts)
@@ -8,6 +8,8 @@ Usage:
     # Add to AutoGen group chat
 """
 
+__all__ = ["BrowsyBrowser", "get_browsy_functions"]
+
 try:
     from autogen import ConversableAgent
 except ImportError:
@@ -16,58 +18,116 @@ except ImportError:
         "Install it with: pip install browsy-ai[autogen]"
     )
 
-from browsy._integrations._shared import get_browser, format_page, format_search_results
+import inspect
+import weakref
+from browsy._integrations._shared import get_browser, format_page, format_page_info, format_search_results, TOOL_DESCRIPTIONS
+
+
+def _browse(b, url: str) -> str:
+    """Navigate to a URL and return page content."""
+    return format_page(b.goto(url))
+
+
+def _click(b, element_id: int) -> str:
+    """Click an element by its ID."""
+    return format_page(b.click(element_id))
+
+
+def _type_text(b, element_id: int, text: str) -> str:
+    """Type text into an input field by element ID."""
+    b.type_text(element_id, text)
+    return f"Typed '{text}' into element {element_id}"
+
+
+def _search(b, query: str) -> str:
+    """Search the web and return results."""
+    return format_search_results(b.search(query))
+
+
+def _login(b, username: str, password: str) -> str:
+    """Log in using detected login form fields."""
+    return format_page(b.login(username, password))
+
+
+def _page_info(b) -> str:
+    """Get current page metadata."""
+    page = b.dom()
+    if page is None:
+        return "No page loaded."
+    return format_page_info(page)
+
+
+def _signature_without_browser(func):
+    sig = inspect.signature(func)
+    return sig.replace(parameters=list(sig.parameters.values())[1:])
+
+
+# (name, function, signature minus the browser argument); only the browser
+# varies per call, so the signatures are worked out once here.
+_FUNCTION_SPECS = tuple(
+    (name, func, _signature_without_browser(func))
+    for name, func in (
+        ("browsy_browse", _browse),
+        ("browsy_click", _click),
+        ("browsy_type_text", _type_text),
+        ("browsy_search", _search),
+        ("browsy_login", _login),
+        ("browsy_page_info", _page_info),
+    )
+)
+_FUNCTION_DESCRIPTIONS = tuple((name, TOOL_DESCRIPTIONS[name]) for name, _, _ in _FUNCTION_SPECS)
 
 
 def get_browsy_functions(browser=None):
-    """Return AutoGen-compatible function definitions for browsy."""
-    b = get_browser(browser)
-
-    def browsy_browse(url: str) -> str:
-        """Navigate to a URL and return page content."""
-        page = b.goto(url)
-        return format_page(page)
-
-    def browsy_click(element_id: int) -> str:
-        """Click an element by its ID."""
-        page = b.click(element_id)
-        return format_page(page)
-
-    def browsy_type_text(element_id: int, text: str) -> str:
-        """Type text into an input field by element ID."""
-        b.type_text(element_id, text)
-        return f"Typed '{text}' into element {element_id}"
-
-    def browsy_search(query: str) -> str:
-        """Search the web and return results."""
-        results = b.search(query)
-        return format_search_results(results)
-
-    def browsy_login(username: str, password: str) -> str:
-        """Log in using detected login form fields."""
-        page = b.login(username, password)
-        return format_page(page)
-
-    def browsy_page_info() -> str:
-        """Get current page metadata."""
-        page = b.dom()
-        if page is None:
-            return "No page loaded."
-        result = f"page_type: {page.page_type}\n"
-        actions = page.suggested_actions()
-        if actions:
-            for a in actions:
-                result += f"  {a}\n"
-        return result
-
-    return [
-        {"name": "browsy_browse", "func": browsy_browse, "description": "Navigate to a URL and return page content with page intelligence."},
-        {"name": "browsy_click", "func": browsy_click, "description": "Click an element by its ID."},
-        {"name": "browsy_type_text", "func": browsy_type_text, "description": "Type text into an input field."},
-        {"name": "browsy_search", "func": browsy_search, "description": "Search the web."},
-        {"name": "browsy_login", "func": browsy_login, "description": "Log in using detected form fields."},
-        {"name": "browsy_page_info", "func": browsy_page_info, "description": "Get page metadata."},
-    ]
+    """Return AutoGen-compatible function definitions for browsy.
+
+    Returns a tuple of ``{"name", "func", "description"}`` dicts. The bound
+    callables are reused for a browser while any caller still holds them.
+    """
+    funcs = _bound_functions(get_browser(browser))
+    return tuple([
+        {"name": name, "func": func, "description": description}
+        for (name, description), func in zip(_FUNCTION_DESCRIPTIONS, funcs)
+    ])
+
+
+# id(browser) -> weak references to its bound functions. Each function keeps
+# its browser alive, so a live entry always belongs to the same browser; once
+# any of them is collected the entry is dropped and the browser can be freed.
+_bound_cache = {}
+
+
+def _bound_functions(b):
+    key = id(b)
+    refs = _bound_cache.get(key)
+    if refs is not None:
+        funcs = [ref() for ref in refs]
+        if None not in funcs:
+            return funcs
+
+    funcs = tuple(_bind(name, func, signature, b) for name, func, signature in _FUNCTION_SPECS)
+
+    def evict(_):
+        if _bound_cache.get(key) is refs:
+            del _bound_cache[key]
+
+    refs = tuple(weakref.ref(func, evict) for func in funcs)
+    _bound_cache[key] = refs
+    return funcs
+
+
+def _bind(name, func, signature, b):
+    # AutoGen only registers plain functions (not functools.partial), builds
+    # the tool schema from the signature, and register_for_execution keys on
+    # __name__. The attributes are set by hand: functools.wraps costs several
+    # times more than the closure itself.
+    def bound(*args, **kwargs):
+        return func(b, *args, **kwargs)
+
+    bound.__name__ = bound.__qualname__ = name
+    bound.__doc__ = func.__doc__
+    bound.__signature__ = signature
+    return bound
 
 
 class BrowsyBrowser(ConversableAgent):
@@ -8,8 +8,23 @@ Usage:
     agent = create_react_agent(llm, tools)
 """
 
+__all__ = [
+    "get_tools",
+    "BrowsyBrowseTool",
+    "BrowsyClickTool",
+    "BrowsyTypeTextTool",
+    "BrowsySearchTool",
+    "BrowsyLoginTool",
+    "BrowsyPageInfoTool",
+    "BrowseInput",
+    "ClickInput",
+    "TypeTextInput",
+    "SearchInput",
+    "LoginInput",
+]
+
 try:
-    from pydantic import BaseModel, Field
+    from pydantic import BaseModel, Field, PrivateAttr
     from langchain.tools import BaseTool
 except ImportError:
     raise ImportError(
@@ -17,8 +32,8 @@ except ImportError:
         "Install it with: pip install browsy-ai[langchain]"
     )
 
-from typing import Optional, Type
-from browsy._integrations._shared import get_browser, format_page, format_search_results
+from typing import Type
+from browsy._integrations._shared import get_browser, format_page, format_page_info, format_search_results
 
 
 class BrowseInput(BaseModel):
@@ -43,151 +58,174 @@ class LoginInput(BaseModel):
     password: str = Field(description="Password")
 
 
-class BrowsyBrowseTool(BaseTool):
-    """Navigate to a URL and return page content with page intelligence."""
+def _init_tool(self, browser=None, **kwargs):
+    BaseTool.__init__(self, **kwargs)
+    self._browser = browser
 
-    name: str = "browsy_browse"
-    description: str = (
-        "Navigate to a URL and return the page content. Returns page type "
-        "(Login, Search, Form, Article, List, etc.), suggested actions with "
-        "element IDs, and all interactive elements."
-    )
-    args_schema: Type[BaseModel] = BrowseInput
-    _browser: object = None
 
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
+def _make_tool(cls_name, doc, name, description, run, args_schema=None, arun=None):
+    """Build a BaseTool subclass bound to a browsy action.
 
-    def _run(self, url: str) -> str:
-        browser = get_browser(self._browser)
-        page = browser.goto(url)
-        return format_page(page)
+    ``arun`` is only given for actions that never touch the network; those
+    run inline on the event loop instead of LangChain's default thread hop.
+    Network actions keep the default, though the native core holds the GIL
+    while fetching, so the event loop still waits on them.
+    """
+    annotations = {"name": str, "description": str}
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": cls_name,
+        "__doc__": doc,
+        "name": name,
+        "description": description,
+        "_browser": PrivateAttr(default=None),
+        "__init__": _init_tool,
+        "_run": run,
+    }
+    if args_schema is not None:
+        annotations["args_schema"] = Type[BaseModel]
+        namespace["args_schema"] = args_schema
+    if arun is not None:
+        namespace["_arun"] = arun
+    namespace["__annotations__"] = annotations
+    return type(BaseTool)(cls_name, (BaseTool,), namespace)
 
 
-class BrowsyClickTool(BaseTool):
-    """Click an element by its ID."""
+def _browse(self, url: str) -> str:
+    return format_page(get_browser(self._browser).goto(url))
 
-    name: str = "browsy_click"
-    description: str = (
-        "Click an element by its ID. Links navigate to new pages, buttons "
-        "submit forms. Returns the resulting page content."
-    )
-    args_schema: Type[BaseModel] = ClickInput
-    _browser: object = None
 
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
+def _click(self, element_id: int) -> str:
+    return format_page(get_browser(self._browser).click(element_id))
 
-    def _run(self, element_id: int) -> str:
-        browser = get_browser(self._browser)
-        page = browser.click(element_id)
-        return format_page(page)
 
+def _type_text(self, element_id: int, text: str) -> str:
+    get_browser(self._browser).type_text(element_id, text)
+    return f"Typed '{text}' into element {element_id}"
 
-class BrowsyTypeTextTool(BaseTool):
-    """Type text into an input field or textarea."""
 
-    name: str = "browsy_type_text"
-    description: str = (
-        "Type text into an input field or textarea by element ID. "
-        "Use browsy_browse first to find the element ID."
-    )
-    args_schema: Type[BaseModel] = TypeTextInput
-    _browser: object = None
+async def _atype_text(self, element_id: int, text: str) -> str:
+    return _type_text(self, element_id, text)
 
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
 
-    def _run(self, element_id: int, text: str) -> str:
-        browser = get_browser(self._browser)
-        browser.type_text(element_id, text)
-        return f"Typed '{text}' into element {element_id}"
+def _search(self, query: str) -> str:
+    return format_search_results(get_browser(self._browser).search(query))
 
 
-class BrowsySearchTool(BaseTool):
-    """Search the web using DuckDuckGo."""
+def _login(self, username: str, password: str) -> str:
+    return format_page(get_browser(self._browser).login(username, password))
 
-    name: str = "browsy_search"
-    description: str = (
-        "Search the web and return structured results with title, URL, and "
-        "snippet. Uses DuckDuckGo. No API key needed."
-    )
-    args_schema: Type[BaseModel] = SearchInput
-    _browser: object = None
 
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
+def _page_info(self) -> str:
+    page = get_browser(self._browser).dom()
+    if page is None:
+        return "No page loaded. Use browsy_browse first."
+    return format_page_info(page)
 
-    def _run(self, query: str) -> str:
-        browser = get_browser(self._browser)
-        results = browser.search(query)
-        return format_search_results(results)
 
+async def _apage_info(self) -> str:
+    return _page_info(self)
 
-class BrowsyLoginTool(BaseTool):
-    """Log in using detected login form fields."""
 
-    name: str = "browsy_login"
-    description: str = (
+BrowsyBrowseTool = _make_tool(
+    "BrowsyBrowseTool",
+    "Navigate to a URL and return page content with page intelligence.",
+    name="browsy_browse",
+    description=(
+        "Navigate to a URL and return the page content. Returns page type "
+        "(Login, Search, Form, Article, List, etc.), suggested actions with "
+        "element IDs, and all interactive elements."
+    ),
+    run=_browse,
+    args_schema=BrowseInput,
+)
+
+BrowsyClickTool = _make_tool(
+    "BrowsyClickTool",
+    "Click an element by its ID.",
+    name="browsy_click",
+    description=(
+        "Click an element by its ID. Links navigate to new pages, buttons "
+        "submit forms. Returns the resulting page content."
+    ),
+    run=_click,
+    args_schema=ClickInput,
+)
+
+BrowsyTypeTextTool = _make_tool(
+    "BrowsyTypeTextTool",
+    "Type text into an input field or textarea.",
+    name="browsy_type_text",
+    description=(
+        "Type text into an input field or textarea by element ID. "
+        "Use browsy_browse first to find the element ID."
+    ),
+    run=_type_text,
+    args_schema=TypeTextInput,
+    arun=_atype_text,
+)
+
+BrowsySearchTool = _make_tool(
+    "BrowsySearchTool",
+    "Search the web using DuckDuckGo.",
+    name="browsy_search",
+    description=(
+        "Search the web and return structured results with title, URL, and "
+        "snippet. Uses DuckDuckGo. No API key needed."
+    ),
+    run=_search,
+    args_schema=SearchInput,
+)
+
+BrowsyLoginTool = _make_tool(
+    "BrowsyLoginTool",
+    "Log in using detected login form fields.",
+    name="browsy_login",
+    description=(
         "Log in to the current page using detected login form fields. "
         "Requires a page with a login form loaded (use browsy_browse first)."
-    )
-    args_schema: Type[BaseModel] = LoginInput
-    _browser: object = None
-
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
-
-    def _run(self, username: str, password: str) -> str:
-        browser = get_browser(self._browser)
-        page = browser.login(username, password)
-        return format_page(page)
+    ),
+    run=_login,
+    args_schema=LoginInput,
+)
+
+BrowsyPageInfoTool = _make_tool(
+    "BrowsyPageInfoTool",
+    "Get page metadata: type, actions, alerts, pagination.",
+    name="browsy_page_info",
+    description=(
+        "Get metadata about the current page: page type, suggested actions "
+        "(login/search/consent), alerts, and pagination info."
+    ),
+    run=_page_info,
+    arun=_apage_info,
+)
 
+_TOOL_CLASSES = (
+    BrowsyBrowseTool,
+    BrowsyClickTool,
+    BrowsyTypeTextTool,
+    BrowsySearchTool,
+    BrowsyLoginTool,
+    BrowsyPageInfoTool,
+)
 
-class BrowsyPageInfoTool(BaseTool):
-    """Get page metadata: type, actions, alerts, pagination."""
 
-    name: str = "browsy_page_info"
-    description: str = (
-        "Get metadata about the current page: page type, suggested actions "
-        "(login/search/consent), alerts, and pagination info."
-    )
-    _browser: object = None
-
-    def __init__(self, browser=None, **kwargs):
-        super().__init__(**kwargs)
-        self._browser = browser
-
-    def _run(self) -> str:
-        browser = get_browser(self._browser)
-        page = browser.dom()
-        if page is None:
-            return "No page loaded. Use browsy_browse first."
-        result = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type}\n"
-        actions = page.suggested_actions()
-        if actions:
-            result += "suggested_actions:\n"
-            for action in actions:
-                result += f"  {action}\n"
-        return result
+# Validated once at import. get_tools hands out shallow copies, which skips
+# re-validation and keeps callbacks/tags/metadata set on one caller's tools
+# from reaching anyone else's.
+_PROTOTYPES = tuple(cls() for cls in _TOOL_CLASSES)
 
 
 def get_tools(browser=None):
     """Return all browsy tools for use with a LangChain agent.
 
+    Each call returns a new tuple of tool instances.
+
     Args:
         browser: Optional Browser instance. If None, a shared default is used.
     """
-    return [
-        BrowsyBrowseTool(browser=browser),
-        BrowsyClickTool(browser=browser),
-        BrowsyTypeTextTool(browser=browser),
-        BrowsySearchTool(browser=browser),
-        BrowsyLoginTool(browser=browser),
-        BrowsyPageInfoTool(browser=browser),
-    ]
+    tools = tuple(proto.model_copy() for proto in _PROTOTYPES)
+    for tool in tools:
+        tool._browser = browser
+    return tools
@@ -9,133 +9,158 @@ Usage:
     result = handle_tool_call(function_name, arguments)
 """
 
-from browsy._integrations._shared import get_browser, format_page, format_search_results
+__all__ = ["get_tool_definitions", "handle_tool_call"]
 
+from browsy._integrations._shared import (
+    get_browser,
+    format_page,
+    format_page_info,
+    format_search_results,
+    load_arguments,
+    TOOL_DESCRIPTIONS,
+)
 
-def get_tool_definitions():
-    """Return OpenAI-compatible tool definitions for browsy."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_browse",
-                "description": (
-                    "Navigate to a URL and return page content with page intelligence. "
-                    "Returns page type (Login, Search, Form, etc.), suggested actions "
-                    "with element IDs, and all interactive elements."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url": {"type": "string", "description": "URL to navigate to"}
-                    },
-                    "required": ["url"],
+
+# Tool schemas are static, so build them once and hand out the same list.
+_TOOL_DEFINITIONS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_browse",
+            "description": TOOL_DESCRIPTIONS["browsy_browse"],
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "description": "URL to navigate to"}
                 },
+                "required": ["url"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_click",
-                "description": "Click an element by its ID. Links navigate, buttons submit forms.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "element_id": {"type": "integer", "description": "Element ID to click"}
-                    },
-                    "required": ["element_id"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_click",
+            "description": TOOL_DESCRIPTIONS["browsy_click"],
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "element_id": {"type": "integer", "description": "Element ID to click"}
                 },
+                "required": ["element_id"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_type_text",
-                "description": "Type text into an input field or textarea by element ID.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "element_id": {"type": "integer", "description": "Element ID of the text input"},
-                        "text": {"type": "string", "description": "Text to type"},
-                    },
-                    "required": ["element_id", "text"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_type_text",
+            "description": TOOL_DESCRIPTIONS["browsy_type_text"],
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "element_id": {"type": "integer", "description": "Element ID of the text input"},
+                    "text": {"type": "string", "description": "Text to type"},
                 },
+                "required": ["element_id", "text"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_search",
-                "description": "Search the web and return results with title, URL, and snippet.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string", "description": "Search query"}
-                    },
-                    "required": ["query"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_search",
+            "description": TOOL_DESCRIPTIONS["browsy_search"],
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"}
                 },
+                "required": ["query"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_login",
-                "description": "Log in using detected login form fields on the current page.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "username": {"type": "string", "description": "Username or email"},
-                        "password": {"type": "string", "description": "Password"},
-                    },
-                    "required": ["username", "password"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_login",
+            "description": TOOL_DESCRIPTIONS["browsy_login"],
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "username": {"type": "string", "description": "Username or email"},
+                    "password": {"type": "string", "description": "Password"},
                 },
+                "required": ["username", "password"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_page_info",
-                "description": "Get current page metadata: type, suggested actions, alerts.",
-                "parameters": {"type": "object", "properties": {}},
-            },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_page_info",
+            "description": TOOL_DESCRIPTIONS["browsy_page_info"],
+            "parameters": {"type": "object", "properties": {}},
         },
-    ]
+    },
+]
+
+
+def get_tool_definitions():
+    """Return OpenAI-compatible tool definitions for browsy.
+
+    The returned list is shared between calls; copy it before mutating.
+    """
+    return _TOOL_DEFINITIONS
+
+
+def _browse(b, arguments):
+    return format_page(b.goto(arguments["url"]))
+
+
+def _click(b, arguments):
+    return format_page(b.click(arguments["element_id"]))
+
+
+def _type_text(b, arguments):
+    b.type_text(arguments["element_id"], arguments["text"])
+    return f"Typed '{arguments['text']}' into element {arguments['element_id']}"
+
+
+def _search(b, arguments):
+    return format_search_results(b.search(arguments["query"]))
+
+
+def _login(b, arguments):
+    return format_page(b.login(arguments["username"], arguments["password"]))
+
+
+def _page_info(b, arguments):
+    page = b.dom()
+    if page is None:
+        return "No page loaded."
+    return format_page_info(page)
+
+
+_HANDLERS = {
+    "browsy_browse": _browse,
+    "browsy_click": _click,
+    "browsy_type_text": _type_text,
+    "browsy_search": _search,
+    "browsy_login": _login,
+    "browsy_page_info": _page_info,
+}
 
 
 def handle_tool_call(function_name, arguments, browser=None):
-    """Handle a tool call from the OpenAI API and return the result string."""
-    b = get_browser(browser)
-
-    if function_name == "browsy_browse":
-        page = b.goto(arguments["url"])
-        return format_page(page)
-
-    elif function_name == "browsy_click":
-        page = b.click(arguments["element_id"])
-        return format_page(page)
-
-    elif function_name == "browsy_type_text":
-        b.type_text(arguments["element_id"], arguments["text"])
-        return f"Typed '{arguments['text']}' into element {arguments['element_id']}"
-
-    elif function_name == "browsy_search":
-        results = b.search(arguments["query"])
-        return format_search_results(results)
-
-    elif function_name == "browsy_login":
-        page = b.login(arguments["username"], arguments["password"])
-        return format_page(page)
-
-    elif function_name == "browsy_page_info":
-        page = b.dom()
-        if page is None:
-            return "No page loaded."
-        result = f"page_type: {page.page_type}\n"
-        actions = page.suggested_actions()
-        if actions:
-            for a in actions:
-                result += f"  {a}\n"
-        return result
-
-    else:
+    """Handle a tool call from the OpenAI API and return the result string.
+
+    Args:
+        function_name: Name of the browsy function to call.
+        arguments: Argument dict, or the raw JSON string from the API.
+        browser: Optional Browser instance. If None, a shared default is used.
+    """
+    handler = _HANDLERS.get(function_name)
+    if handler is None:
         return f"Unknown function: {function_name}"
+    return handler(get_browser(browser), load_arguments(arguments))
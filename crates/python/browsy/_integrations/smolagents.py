@@ -7,6 +7,8 @@ Usage:
     agent = CodeAgent(tools=[BrowsyTool()])
 """
 
+__all__ = ["BrowsyTool"]
+
 try:
     from smolagents import Tool
 except ImportError:
@@ -15,7 +17,7 @@ except ImportError:
         "Install it with: pip install browsy-ai[smolagents]"
     )
 
-from browsy._integrations._shared import get_browser, format_page, format_search_results
+from browsy._integrations._shared import get_browser, run_command
 
 
 class BrowsyTool(Tool):
@@ -47,57 +49,4 @@ class BrowsyTool(Tool):
         self._browser = browser
 
     def forward(self, action: str) -> str:
-        browser = get_browser(self._browser)
-        parts = action.strip().split(None, 2)
-        if not parts:
-            return "Error: empty command."
-
-        cmd = parts[0].lower()
-
-        if cmd == "browse" and len(parts) >= 2:
-            page = browser.goto(parts[1])
-            return format_page(page)
-
-        elif cmd == "click" and len(parts) >= 2:
-            try:
-                eid = int(parts[1])
-            except ValueError:
-                return f"Error: invalid element ID '{parts[1]}'"
-            page = browser.click(eid)
-            return format_page(page)
-
-        elif cmd == "type" and len(parts) >= 3:
-            try:
-                eid = int(parts[1])
-            except ValueError:
-                return f"Error: invalid element ID '{parts[1]}'"
-            browser.type_text(eid, parts[2])
-            return f"Typed '{parts[2]}' into element {eid}"
-
-        elif cmd == "search" and len(parts) >= 2:
-            query = " ".join(parts[1:])
-            results = browser.search(query)
-            return format_search_results(results)
-
-        elif cmd == "login" and len(parts) >= 3:
-            page = browser.login(parts[1], parts[2])
-            return format_page(page)
-
-        elif cmd == "info":
-            page = browser.dom()
-            if page is None:
-                return "No page loaded. Use 'browse <url>' first."
-            result = f"page_type: {page.page_type}\n"
-            actions = page.suggested_actions()
-            if actions:
-                result += "suggested_actions:\n"
-                for a in actions:
-                    result += f"  {a}\n"
-            return result
-
-        elif cmd == "back":
-            page = browser.back()
-            return format_page(page)
-
-        else:
-            return f"Unknown command '{cmd}'. Available: browse, click, type, search, login, info, back"
+        return run_command(get_browser(self._browser), action)
@@ -1,3 +1,2 @@
 """browsy AutoGen integration. Install: pip install browsy-ai[autogen]"""
 from browsy._integrations.autogen import *  # noqa: F401,F403
-from browsy._integrations.autogen import BrowsyBrowser
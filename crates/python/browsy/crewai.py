@@ -1,3 +1,2 @@
 """browsy CrewAI integration. Install: pip install browsy-ai[crewai]"""
 from browsy._integrations.crewai import *  # noqa: F401,F403
-from browsy._integrations.crewai import BrowsyTool
@@ -1,3 +1,2 @@
 """browsy LangChain integration. Install: pip install browsy-ai[langchain]"""
 from browsy._integrations.langchain import *  # noqa: F401,F403
-from browsy._integrations.langchain import get_tools, BrowsyBrowseTool, BrowsyClickTool, BrowsyTypeTextTool, BrowsySearchTool, BrowsyLoginTool, BrowsyPageInfoTool
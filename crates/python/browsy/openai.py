@@ -1,3 +1,2 @@
 """browsy OpenAI integration. Install: pip install browsy-ai[openai]"""
 from browsy._integrations.openai import *  # noqa: F401,F403
-from browsy._integrations.openai import get_tool_definitions, handle_tool_call
@@ -1,3 +1,2 @@
 """browsy Smolagents integration. Install: pip install browsy-ai[smolagents]"""
 from browsy._integrations.smolagents import *  # noqa: F401,F403
-from browsy._integrations.smolagents import BrowsyTool
@@ -1,7 +1,12 @@
 //! Python bindings for browsy via PyO3.
 
 use pyo3::prelude::*;
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyIndexError, PyRuntimeError};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::PySlice;
+
+use std::collections::HashMap;
+use std::sync::{Arc, OnceLock};
 
 use browsy_core::fetch::{InputPurpose, Session, SessionConfig};
 use browsy_core::output::{self, SpatialDom, SpatialElement as CoreElement};
@@ -38,6 +43,40 @@ fn json_to_py(py: Python<'_>, val: serde_json::Value) -> PyObject {
 
 // --- Element ---
 
+/// Tag names and input types common enough to be worth interning. Values
+/// outside this list (custom elements, odd `type=` attributes) come from page
+/// content and are returned as ordinary strings so they cannot grow the
+/// interpreter's intern table.
+const INTERNED_NAMES: &[&str] = &[
+    // tags
+    "a", "button", "input", "select", "textarea", "option", "details", "summary",
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "label", "span", "div", "li", "ul", "ol",
+    "td", "th", "tr", "table", "dt", "dd", "figcaption", "blockquote", "pre", "code",
+    "em", "strong", "b", "i", "mark", "small", "img", "iframe", "dialog",
+    "nav", "main", "header", "footer", "aside", "section", "form", "article",
+    // input types
+    "text", "email", "password", "checkbox", "radio", "submit", "reset", "search",
+    "tel", "url", "number", "date", "datetime-local", "month", "week", "time",
+    "color", "file", "hidden", "image", "range",
+];
+
+/// Python strings for `INTERNED_NAMES`, built once per interpreter so a hit is
+/// a hash lookup and a refcount bump rather than a new string.
+static NAME_STRINGS: GILOnceCell<HashMap<&'static str, Py<pyo3::types::PyString>>> = GILOnceCell::new();
+
+fn name_to_py<'py>(py: Python<'py>, name: &str) -> Bound<'py, pyo3::types::PyString> {
+    let names = NAME_STRINGS.get_or_init(py, || {
+        INTERNED_NAMES
+            .iter()
+            .map(|&n| (n, pyo3::types::PyString::intern(py, n).unbind()))
+            .collect()
+    });
+    match names.get(name) {
+        Some(s) => s.clone_ref(py).into_bound(py),
+        None => pyo3::types::PyString::new(py, name),
+    }
+}
+
 #[pyclass(frozen)]
 #[derive(Clone)]
 struct Element {
@@ -52,8 +91,8 @@ impl Element {
     }
 
     #[getter]
-    fn tag(&self) -> &str {
-        &self.inner.tag
+    fn tag<'py>(&self, py: Python<'py>) -> Bound<'py, pyo3::types::PyString> {
+        name_to_py(py, &self.inner.tag)
     }
 
     #[getter]
@@ -82,8 +121,8 @@ impl Element {
     }
 
     #[getter]
-    fn input_type(&self) -> Option<&str> {
-        self.inner.input_type.as_deref()
+    fn input_type<'py>(&self, py: Python<'py>) -> Option<Bound<'py, pyo3::types::PyString>> {
+        self.inner.input_type.as_deref().map(|t| name_to_py(py, t))
     }
 
     #[getter]
@@ -142,12 +181,124 @@ impl Element {
     }
 }
 
+// --- ElementsView ---
+
+/// Read-only sequence over a page's elements, or over a subset of them given
+/// as positions in `els`. `Element` wrappers are only built for the items
+/// actually indexed or iterated.
+#[pyclass(frozen)]
+struct ElementsView {
+    dom: Arc<SpatialDom>,
+    positions: Option<Arc<[usize]>>,
+}
+
+impl ElementsView {
+    fn len(&self) -> usize {
+        self.positions.as_ref().map_or(self.dom.els.len(), |p| p.len())
+    }
+
+    fn element(&self, k: usize) -> Element {
+        let i = self.positions.as_ref().map_or(k, |p| p[k]);
+        Element { inner: self.dom.els[i].clone() }
+    }
+}
+
+#[pymethods]
+impl ElementsView {
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let len = self.len();
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let ind = slice.indices(len as isize)?;
+            let items: Vec<Element> = (0..ind.slicelength as usize)
+                .map(|k| self.element((ind.start + k as isize * ind.step) as usize))
+                .collect();
+            return Ok(items.into_pyobject(py)?.into_any().unbind());
+        }
+        let i: isize = index.extract()?;
+        let pos = if i < 0 { i + len as isize } else { i };
+        if pos < 0 || pos as usize >= len {
+            return Err(PyIndexError::new_err("element index out of range"));
+        }
+        Ok(self.element(pos as usize).into_pyobject(py)?.into_any().unbind())
+    }
+
+    fn __iter__(&self) -> ElementsIter {
+        ElementsIter {
+            dom: Arc::clone(&self.dom),
+            positions: self.positions.clone(),
+            pos: 0,
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("<ElementsView len={}>", self.len())
+    }
+}
+
+#[pyclass]
+struct ElementsIter {
+    dom: Arc<SpatialDom>,
+    positions: Option<Arc<[usize]>>,
+    pos: usize,
+}
+
+#[pymethods]
+impl ElementsIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self) -> Option<Element> {
+        let i = match &self.positions {
+            Some(p) => *p.get(self.pos)?,
+            None => self.pos,
+        };
+        let e = self.dom.els.get(i)?;
+        self.pos += 1;
+        Some(Element { inner: e.clone() })
+    }
+}
+
 // --- Page ---
 
 #[pyclass]
-#[derive(Clone)]
 struct Page {
-    inner: SpatialDom,
+    inner: Arc<SpatialDom>,
+    // Pages are immutable snapshots, so derived Python objects are built once.
+    actions: GILOnceCell<Py<pyo3::types::PyTuple>>,
+    compact: GILOnceCell<Py<pyo3::types::PyString>>,
+    // input_type -> positions in `inner.els`, built on first lookup.
+    inputs: OnceLock<HashMap<String, Vec<usize>>>,
+    // Positions of non-hidden elements in `inner.els`, built on first lookup.
+    visible: OnceLock<Arc<[usize]>>,
+}
+
+impl Page {
+    fn new(inner: SpatialDom) -> Self {
+        Page {
+            inner: Arc::new(inner),
+            actions: GILOnceCell::new(),
+            compact: GILOnceCell::new(),
+            inputs: OnceLock::new(),
+            visible: OnceLock::new(),
+        }
+    }
+
+    fn input_index(&self) -> &HashMap<String, Vec<usize>> {
+        self.inputs.get_or_init(|| {
+            let mut index: HashMap<String, Vec<usize>> = HashMap::new();
+            for (i, e) in self.inner.els.iter().enumerate() {
+                if let Some(t) = &e.input_type {
+                    index.entry(t.clone()).or_default().push(i);
+                }
+            }
+            index
+        })
+    }
 }
 
 #[pymethods]
@@ -163,12 +314,18 @@ impl Page {
     }
 
     #[getter]
-    fn elements(&self) -> Vec<Element> {
-        self.inner.els.iter().map(|e| Element { inner: e.clone() }).collect()
+    fn elements(&self) -> ElementsView {
+        ElementsView { dom: Arc::clone(&self.inner), positions: None }
     }
 
-    fn visible(&self) -> Vec<Element> {
-        self.inner.visible().into_iter().map(|e| Element { inner: e.clone() }).collect()
+    fn visible(&self) -> ElementsView {
+        let positions = self.visible.get_or_init(|| {
+            self.inner.els.iter().enumerate()
+                .filter(|(_, e)| e.hidden != Some(true))
+                .map(|(i, _)| i)
+                .collect()
+        });
+        ElementsView { dom: Arc::clone(&self.inner), positions: Some(Arc::clone(positions)) }
     }
 
     fn above_fold(&self) -> Vec<Element> {
@@ -179,6 +336,20 @@ impl Page {
         self.inner.get(id).map(|e| Element { inner: e.clone() })
     }
 
+    fn inputs_by_type(&self, kind: &str) -> Vec<Element> {
+        self.input_index()
+            .get(kind)
+            .map(|idx| idx.iter().map(|&i| Element { inner: self.inner.els[i].clone() }).collect())
+            .unwrap_or_default()
+    }
+
+    fn filter_input_type(&self, kind: &str) -> Vec<u32> {
+        self.input_index()
+            .get(kind)
+            .map(|idx| idx.iter().map(|&i| self.inner.els[i].id).collect())
+            .unwrap_or_default()
+    }
+
     fn tables(&self) -> Vec<PyObject> {
         Python::with_gil(|py| {
             self.inner.tables().into_iter().map(|t| {
@@ -212,20 +383,38 @@ impl Page {
     }
 
     fn to_json(&self) -> PyResult<String> {
-        serde_json::to_string(&self.inner)
+        serde_json::to_string(&*self.inner)
             .map_err(|e| PyRuntimeError::new_err(e.to_string()))
     }
 
-    fn to_compact(&self) -> String {
-        output::to_compact_string(&self.inner)
+    fn to_json_bytes(&self) -> PyResult<Py<pyo3::types::PyBytes>> {
+        let buf = serde_json::to_vec(&*self.inner)
+            .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+        Ok(Python::with_gil(|py| pyo3::types::PyBytes::new(py, &buf).unbind()))
     }
 
-    fn suggested_actions(&self) -> Vec<PyObject> {
+    fn to_compact(&self) -> Py<pyo3::types::PyString> {
         Python::with_gil(|py| {
-            self.inner.suggested_actions.iter().map(|a| {
-                let val = serde_json::to_value(a).unwrap();
-                json_to_py(py, val)
-            }).collect()
+            self.compact
+                .get_or_init(py, || {
+                    pyo3::types::PyString::new(py, &output::to_compact_string(&self.inner)).unbind()
+                })
+                .clone_ref(py)
+        })
+    }
+
+    /// Detected action recipes. The tuple and its dicts are shared by every
+    /// caller on this page, so callers must copy an action before mutating it.
+    fn suggested_actions(&self) -> PyResult<Py<pyo3::types::PyTuple>> {
+        Python::with_gil(|py| {
+            let actions = self.actions.get_or_try_init(py, || {
+                let actions = self.inner.suggested_actions.iter().map(|a| {
+                    let val = serde_json::to_value(a).unwrap();
+                    json_to_py(py, val)
+                });
+                pyo3::types::PyTuple::new(py, actions).map(Bound::unbind)
+            })?;
+            Ok(actions.clone_ref(py))
         })
     }
 
@@ -245,6 +434,20 @@ struct Browser {
     session: Session,
 }
 
+impl Browser {
+    /// The current page with form state overlaid, if the caller asked for it.
+    /// Building it clones the DOM, so form setters skip it by default.
+    fn page_if(&self, return_page: bool) -> PyResult<Option<Page>> {
+        if !return_page {
+            return Ok(None);
+        }
+        self.session
+            .dom()
+            .map(|dom| Some(Page::new(dom)))
+            .ok_or_else(|| PyRuntimeError::new_err("No page loaded"))
+    }
+}
+
 #[pymethods]
 impl Browser {
     #[new]
@@ -261,37 +464,49 @@ impl Browser {
 
     fn goto(&mut self, url: &str) -> PyResult<Page> {
         let dom = self.session.goto(url).map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 
     fn click(&mut self, id: u32) -> PyResult<Page> {
         let dom = self.session.click(id).map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 
-    fn type_text(&mut self, id: u32, text: &str) -> PyResult<()> {
-        self.session.type_text(id, text).map_err(convert_err)
+    #[pyo3(signature = (id, text, *, return_page=false))]
+    fn type_text(&mut self, id: u32, text: &str, return_page: bool) -> PyResult<Option<Page>> {
+        self.session.type_text(id, text).map_err(convert_err)?;
+        self.page_if(return_page)
     }
 
-    fn check(&mut self, id: u32) -> PyResult<()> {
-        self.session.check(id).map_err(convert_err)
+    #[pyo3(signature = (id, *, return_page=false))]
+    fn check(&mut self, id: u32, return_page: bool) -> PyResult<Option<Page>> {
+        self.session.check(id).map_err(convert_err)?;
+        self.page_if(return_page)
     }
 
-    fn uncheck(&mut self, id: u32) -> PyResult<()> {
-        self.session.uncheck(id).map_err(convert_err)
+    #[pyo3(signature = (id, *, return_page=false))]
+    fn uncheck(&mut self, id: u32, return_page: bool) -> PyResult<Option<Page>> {
+        self.session.uncheck(id).map_err(convert_err)?;
+        self.page_if(return_page)
     }
 
-    fn select(&mut self, id: u32, value: &str) -> PyResult<()> {
-        self.session.select(id, value).map_err(convert_err)
+    #[pyo3(signature = (id, value, *, return_page=false))]
+    fn select(&mut self, id: u32, value: &str, return_page: bool) -> PyResult<Option<Page>> {
+        self.session.select(id, value).map_err(convert_err)?;
+        self.page_if(return_page)
     }
 
     fn back(&mut self) -> PyResult<Page> {
         let dom = self.session.back().map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 
     fn dom(&self) -> Option<Page> {
-        self.session.dom().map(|d| Page { inner: d })
+        self.session.dom().map(Page::new)
+    }
+
+    fn reset(&mut self) {
+        self.session.reset();
     }
 
     fn search(&mut self, query: &str) -> PyResult<Vec<PyObject>> {
@@ -323,12 +538,12 @@ impl Browser {
 
     fn login(&mut self, username: &str, password: &str) -> PyResult<Page> {
         let dom = self.session.login(username, password).map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 
     fn enter_code(&mut self, code: &str) -> PyResult<Page> {
         let dom = self.session.enter_code(code).map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 
     fn find_by_text_fuzzy(&self, text: &str) -> Vec<Element> {
@@ -357,7 +572,7 @@ impl Browser {
 
     fn load_html(&mut self, html: &str, url: &str) -> PyResult<Page> {
         let dom = self.session.load_html(html, url).map_err(convert_err)?;
-        Ok(Page { inner: dom })
+        Ok(Page::new(dom))
     }
 }
 
@@ -1,4 +1,7 @@
 """Tests for browsy AutoGen integration."""
+import gc
+import sys
+
 import pytest
 from browsy import Browser
 
@@ -11,19 +14,46 @@ except ImportError:
 pytestmark = pytest.mark.skipif(not HAS_AUTOGEN, reason="pyautogen not installed")
 
 
-def test_get_functions_count():
-    funcs = get_browsy_functions()
+@pytest.fixture(scope="module")
+def shared_browser():
+    return Browser()
+
+
+def test_get_functions_count(shared_browser):
+    funcs = get_browsy_functions(browser=shared_browser)
     assert len(funcs) == 6
 
 
-def test_get_functions_names():
-    funcs = get_browsy_functions()
+def test_get_functions_names(shared_browser):
+    funcs = get_browsy_functions(browser=shared_browser)
     names = {f["name"] for f in funcs}
     assert "browsy_browse" in names
     assert "browsy_click" in names
     assert "browsy_page_info" in names
 
 
-def test_browser_agent_creation():
-    agent = BrowsyBrowser(name="test_browser", browser=Browser())
+def test_function_names_match_specs(shared_browser):
+    # register_for_execution maps tool calls by the callable's __name__.
+    funcs = get_browsy_functions(browser=shared_browser)
+    assert all(f["func"].__name__ == f["name"] for f in funcs)
+
+
+def test_functions_reused_while_held(shared_browser):
+    first = get_browsy_functions(browser=shared_browser)
+    second = get_browsy_functions(browser=shared_browser)
+    assert all(a["func"] is b["func"] for a, b in zip(first, second))
+
+
+def test_functions_release_browser():
+    browser = Browser()
+    refs = sys.getrefcount(browser)
+    funcs = get_browsy_functions(browser=browser)
+    assert sys.getrefcount(browser) > refs
+    del funcs
+    gc.collect()
+    assert sys.getrefcount(browser) == refs
+
+
+def test_browser_agent_creation(shared_browser):
+    agent = BrowsyBrowser(name="test_browser", browser=shared_browser)
     assert agent.name == "test_browser"
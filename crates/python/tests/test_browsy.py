@@ -3,11 +3,17 @@ import pytest
 from browsy import Browser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def browser():
     return Browser()
 
 
+@pytest.fixture(autouse=True)
+def _reset_browser(browser):
+    yield
+    browser.reset()
+
+
 SIMPLE_HTML = """
 <html>
 <head><title>Test Page</title></head>
@@ -105,14 +111,26 @@ def test_page_elements(browser):
     elements = page.elements
     tags = [e.tag for e in elements]
     assert "a" in tags
+    # Common tag names are cached Python strings shared across pages.
+    other = browser.load_html(SIMPLE_HTML, "https://example.com/other")
+    assert other.elements[0].tag is elements[0].tag
     texts = [e.text for e in elements if e.text]
     assert any("Welcome" in t for t in texts)
 
 
+def test_elements_view(browser):
+    page = browser.load_html(SIMPLE_HTML, "https://example.com")
+    elements = page.elements
+    assert len(elements) == len(page)
+    assert elements[-1].id == elements[len(elements) - 1].id
+    assert [e.id for e in elements[:2]] == [e.id for e in list(elements)[:2]]
+    with pytest.raises(IndexError):
+        elements[len(elements)]
+
+
 def test_element_properties(browser):
     page = browser.load_html(FORM_HTML, "https://example.com/form")
-    elements = page.elements
-    email_input = [e for e in elements if e.input_type == "email"]
+    email_input = page.inputs_by_type("email")
     assert len(email_input) > 0
     el = email_input[0]
     assert el.name == "email"
@@ -125,9 +143,9 @@ def test_element_properties(browser):
 def test_type_text(browser):
     browser.load_html(FORM_HTML, "https://example.com/form")
     page = browser.dom()
-    email_input = [e for e in page.elements if e.input_type == "email"][0]
-    browser.type_text(email_input.id, "test@test.com")
-    page = browser.dom()
+    email_input = page.inputs_by_type("email")[0]
+    assert browser.type_text(email_input.id, "test@test.com") is None
+    page = browser.type_text(email_input.id, "test@test.com", return_page=True)
     compact = page.to_compact()
     assert "test@test.com" in compact
 
@@ -135,16 +153,13 @@ def test_type_text(browser):
 def test_check_uncheck(browser):
     browser.load_html(FORM_HTML, "https://example.com/form")
     page = browser.dom()
-    checkbox = [e for e in page.elements if e.input_type == "checkbox"][0]
+    cb_id = page.filter_input_type("checkbox")[0]
 
-    browser.check(checkbox.id)
-    page = browser.dom()
-    cb = page.get(checkbox.id)
+    cb = browser.check(cb_id, return_page=True).get(cb_id)
     assert cb.checked == True
+    assert browser.dom().get(cb_id).checked == True
 
-    browser.uncheck(checkbox.id)
-    page = browser.dom()
-    cb = page.get(checkbox.id)
+    cb = browser.uncheck(cb_id, return_page=True).get(cb_id)
     assert cb.checked == False
 
 
@@ -208,6 +223,7 @@ def test_to_compact(browser):
     compact = page.to_compact()
     assert isinstance(compact, str)
     assert "About" in compact
+    assert page.to_compact() is compact
 
 
 def test_to_json(browser):
@@ -218,6 +234,13 @@ def test_to_json(browser):
     assert "els" in data
 
 
+def test_to_json_bytes(browser):
+    page = browser.load_html(SIMPLE_HTML, "https://example.com")
+    raw = page.to_json_bytes()
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == json.loads(page.to_json())
+
+
 def test_tables(browser):
     page = browser.load_html(TABLE_HTML, "https://example.com/table")
     tables = page.tables()
@@ -236,6 +259,8 @@ def test_visible(browser):
     visible_els = page.visible()
     # Hidden elements should be in all but not visible
     assert len(all_els) >= len(visible_els)
+    assert len(list(visible_els)) == len(visible_els)
+    assert all(not e.hidden for e in visible_els)
     hidden_texts = [e.text for e in all_els if e.hidden and e.text]
     visible_texts = [e.text for e in visible_els if e.text]
     # "Hidden link" should be in all elements but not in visible
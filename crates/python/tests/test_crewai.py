@@ -13,9 +13,20 @@ pytestmark = pytest.mark.skipif(not HAS_CREWAI, reason="crewai not installed")
 SIMPLE_HTML = '<html><head><title>Test</title></head><body><h1>Hello</h1><a href="/about">About</a></body></html>'
 
 
-@pytest.fixture
-def tool():
-    return BrowsyTool(browser=Browser())
+@pytest.fixture(scope="module")
+def browser():
+    return Browser()
+
+
+@pytest.fixture(scope="module")
+def tool(browser):
+    return BrowsyTool(browser=browser)
+
+
+@pytest.fixture(autouse=True)
+def _reset_browser(browser):
+    yield
+    browser.reset()
 
 
 def test_tool_name(tool):
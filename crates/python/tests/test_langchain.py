@@ -1,4 +1,6 @@
 """Tests for browsy LangChain integration."""
+import asyncio
+
 import pytest
 from browsy import Browser
 
@@ -37,6 +39,29 @@ def test_browse_tool_with_load_html(browser):
     assert "Test" in result
 
 
+def test_page_info_tool_page_type(browser):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    tools = get_tools(browser=browser)
+    info_tool = [t for t in tools if t.name == "browsy_page_info"][0]
+    assert "page_type: Login" in info_tool._run()
+
+
+def test_page_info_tool_ainvoke(browser):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    tools = get_tools(browser=browser)
+    info_tool = [t for t in tools if t.name == "browsy_page_info"][0]
+    assert asyncio.run(info_tool.ainvoke({})) == info_tool.invoke({})
+
+
+def test_type_text_tool_ainvoke(browser):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    input_id = browser.dom().inputs_by_type("text")[0].id
+    tools = get_tools(browser=browser)
+    type_tool = [t for t in tools if t.name == "browsy_type_text"][0]
+    args = {"element_id": input_id, "text": "jane q public"}
+    assert asyncio.run(type_tool.ainvoke(args)) == type_tool.invoke(args)
+
+
 def test_tool_names(browser):
     tools = get_tools(browser=browser)
     names = {t.name for t in tools}
@@ -42,3 +42,8 @@ def test_handle_unknown_function():
 def test_handle_page_info_no_page():
     result = handle_tool_call("browsy_page_info", {}, browser=Browser())
     assert "No page loaded" in result
+
+
+def test_handle_tool_call_json_arguments():
+    result = handle_tool_call("browsy_page_info", "{}", browser=Browser())
+    assert "No page loaded" in result
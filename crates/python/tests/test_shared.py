@@ -0,0 +1,84 @@
+"""Tests for the helpers shared by the browsy framework integrations."""
+import pytest
+from browsy import Browser
+from browsy._integrations._shared import (
+    format_page,
+    format_page_info,
+    get_browser,
+    reset_default_browser,
+    run_command,
+)
+
+LOGIN_HTML = '<html><head><title>Login</title></head><body><form action="/login" method="post"><input type="text" name="username" /><input type="password" name="password" /><button type="submit">Log In</button></form></body></html>'
+
+
+@pytest.fixture(scope="module")
+def browser():
+    return Browser()
+
+
+@pytest.fixture(autouse=True)
+def _reset_browser(browser):
+    yield
+    browser.reset()
+
+
+def test_format_page_info_page_type(browser):
+    page = browser.load_html(LOGIN_HTML, "https://example.com/login")
+    result = format_page_info(page)
+    assert "page_type: Login" in result
+    assert "built-in method" not in result
+
+
+def test_format_page_page_type(browser):
+    page = browser.load_html(LOGIN_HTML, "https://example.com/login")
+    result = format_page(page)
+    assert result.startswith("title: Login\nurl: https://example.com/login\npage_type: Login")
+
+
+@pytest.mark.parametrize("command", ["info", "INFO", "Info", "  info  "])
+def test_run_command_info(browser, command):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    assert run_command(browser, command) == format_page_info(browser.dom())
+
+
+def test_run_command_back(browser):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    with pytest.raises(RuntimeError, match="No history"):
+        run_command(browser, "back")
+
+
+def test_run_command_type_multi_word(browser):
+    browser.load_html(LOGIN_HTML, "https://example.com/login")
+    input_id = browser.dom().inputs_by_type("text")[0].id
+    result = run_command(browser, f"type {input_id} jane q public")
+    assert result == f"Typed 'jane q public' into element {input_id}"
+    assert "jane q public" in browser.dom().to_compact()
+
+
+@pytest.mark.parametrize("command", ["type 3", "login u"])
+def test_run_command_too_few_arguments(browser, command):
+    result = run_command(browser, command)
+    assert result.startswith(f"Unknown command '{command.split()[0]}'")
+
+
+@pytest.fixture
+def _fresh_default():
+    reset_default_browser()
+    yield
+    reset_default_browser()
+
+
+def test_get_browser_default_is_shared(_fresh_default):
+    assert get_browser() is get_browser()
+
+
+def test_reset_default_browser(_fresh_default):
+    first = get_browser()
+    reset_default_browser()
+    assert get_browser() is not first
+
+
+def test_get_browser_explicit(_fresh_default, browser):
+    assert get_browser(browser) is browser
+    assert get_browser() is not browser
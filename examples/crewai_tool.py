@@ -13,7 +13,7 @@ Usage:
     agent = Agent(tools=[BrowsyTool()])
 """
 
-from typing import Optional
+from typing import ClassVar, Optional
 from crewai.tools import BaseTool
 from browsy import Browser
 
@@ -46,82 +46,92 @@ class BrowsyTool(BaseTool):
     def model_post_init(self, __context) -> None:
         self._browser = Browser()
 
+    # verb -> (handler method name, minimum number of command parts)
+    _DISPATCH: ClassVar[dict] = {
+        "browse": ("_do_browse", 2),
+        "click": ("_do_click", 2),
+        "type": ("_do_type", 3),
+        "search": ("_do_search", 2),
+        "login": ("_do_login", 3),
+        "info": ("_do_info", 1),
+        "back": ("_do_back", 1),
+    }
+
     def _run(self, command: str) -> str:
         parts = command.strip().split(None, 2)
         if not parts:
             return "Error: empty command. Use 'browse <url>', 'click <id>', etc."
 
-        action = parts[0].lower()
-
-        if action == "browse" and len(parts) >= 2:
-            url = parts[1]
-            page = self._browser.goto(url)
-            return self._format_page(page)
-
-        elif action == "click" and len(parts) >= 2:
-            try:
-                element_id = int(parts[1])
-            except ValueError:
-                return f"Error: invalid element ID '{parts[1]}'"
-            page = self._browser.click(element_id)
-            return self._format_page(page)
-
-        elif action == "type" and len(parts) >= 3:
-            try:
-                element_id = int(parts[1])
-            except ValueError:
-                return f"Error: invalid element ID '{parts[1]}'"
-            text = parts[2]
-            self._browser.type_text(element_id, text)
-            return f"Typed '{text}' into element {element_id}"
-
-        elif action == "search" and len(parts) >= 2:
-            query = " ".join(parts[1:])
-            results = self._browser.search(query)
-            lines = []
-            for i, r in enumerate(results, 1):
-                lines.append(f"{i}. {r['title']}")
-                lines.append(f"   {r['url']}")
-                if r.get("snippet"):
-                    lines.append(f"   {r['snippet']}")
-                lines.append("")
-            return "\n".join(lines) if lines else "No results found."
-
-        elif action == "login" and len(parts) >= 3:
-            username = parts[1]
-            password = parts[2]
-            page = self._browser.login(username, password)
-            return self._format_page(page)
-
-        elif action == "info":
-            page = self._browser.dom()
-            if page is None:
-                return "No page loaded. Use 'browse <url>' first."
-            result = f"page_type: {page.page_type}\n"
-            actions = page.suggested_actions()
-            if actions:
-                result += "suggested_actions:\n"
-                for a in actions:
-                    result += f"  {a}\n"
-            return result
-
-        elif action == "back":
-            page = self._browser.back()
-            return self._format_page(page)
-
-        else:
+        action = parts[0]
+        if action not in self._DISPATCH:
+            action = action.lower()
+        entry = self._DISPATCH.get(action)
+        if entry is None or len(parts) < entry[1]:
             return (
                 f"Unknown command '{action}'. Available: "
                 "browse, click, type, search, login, info, back"
             )
-
-    def _format_page(self, page) -> str:
-        result = f"title: {page.title}\nurl: {page.url}\n"
-        result += f"page_type: {page.page_type}\n"
+        return getattr(self, entry[0])(parts)
+
+    def _do_browse(self, parts) -> str:
+        page = self._browser.goto(parts[1])
+        return self._format_page(page)
+
+    def _do_click(self, parts) -> str:
+        try:
+            element_id = int(parts[1])
+        except ValueError:
+            return f"Error: invalid element ID '{parts[1]}'"
+        page = self._browser.click(element_id)
+        return self._format_page(page)
+
+    def _do_type(self, parts) -> str:
+        try:
+            element_id = int(parts[1])
+        except ValueError:
+            return f"Error: invalid element ID '{parts[1]}'"
+        text = parts[2]
+        self._browser.type_text(element_id, text)
+        return f"Typed '{text}' into element {element_id}"
+
+    def _do_search(self, parts) -> str:
+        query = " ".join(parts[1:])
+        results = self._browser.search(query)
+        lines = []
+        for i, r in enumerate(results, 1):
+            lines.append(f"{i}. {r['title']}")
+            lines.append(f"   {r['url']}")
+            if r.get("snippet"):
+                lines.append(f"   {r['snippet']}")
+            lines.append("")
+        return "\n".join(lines) if lines else "No results found."
+
+    def _do_login(self, parts) -> str:
+        page = self._browser.login(parts[1], parts[2])
+        return self._format_page(page)
+
+    def _do_info(self, parts) -> str:
+        page = self._browser.dom()
+        if page is None:
+            return "No page loaded. Use 'browse <url>' first."
+        result = f"page_type: {page.page_type()}\n"
         actions = page.suggested_actions()
         if actions:
             result += "suggested_actions:\n"
             for a in actions:
                 result += f"  {a}\n"
-        result += f"---\n{page.to_compact()}"
         return result
+
+    def _do_back(self, parts) -> str:
+        page = self._browser.back()
+        return self._format_page(page)
+
+    def _format_page(self, page) -> str:
+        parts = [f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type()}"]
+        actions = page.suggested_actions()
+        if actions:
+            parts.append("suggested_actions:")
+            parts.extend(f"  {a}" for a in actions)
+        parts.append("---")
+        parts.append(page.to_compact())
+        return "\n".join(parts)
@@ -20,8 +20,20 @@ from langchain.tools import BaseTool
 from browsy import Browser
 
 
-# Shared browser instance across tools
-_browser = Browser()
+# Shared browser instance across tools, created on first use
+_browser = None
+
+
+def _get_browser():
+    """Return the shared Browser, creating it on first use."""
+    global _browser
+    if _browser is None:
+        _browser = Browser()
+    return _browser
+
+
+def _page_header(page) -> str:
+    return f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type()}"
 
 
 class BrowseInput(BaseModel):
@@ -59,17 +71,15 @@ class BrowsyBrowseTool(BaseTool):
     args_schema: Type[BaseModel] = BrowseInput
 
     def _run(self, url: str) -> str:
-        page = _browser.goto(url)
-        result = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type}\n"
-
+        page = _get_browser().goto(url)
+        parts = [_page_header(page)]
         actions = page.suggested_actions()
         if actions:
-            result += "suggested_actions:\n"
-            for action in actions:
-                result += f"  {action}\n"
-
-        result += f"---\n{page.to_compact()}"
-        return result
+            parts.append("suggested_actions:")
+            parts.extend(f"  {action}" for action in actions)
+        parts.append("---")
+        parts.append(page.to_compact())
+        return "\n".join(parts)
 
 
 class BrowsyClickTool(BaseTool):
@@ -83,10 +93,8 @@ class BrowsyClickTool(BaseTool):
     args_schema: Type[BaseModel] = ClickInput
 
     def _run(self, element_id: int) -> str:
-        page = _browser.click(element_id)
-        result = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type}\n"
-        result += f"---\n{page.to_compact()}"
-        return result
+        page = _get_browser().click(element_id)
+        return f"{_page_header(page)}\n---\n{page.to_compact()}"
 
 
 class BrowsyTypeTextTool(BaseTool):
@@ -100,7 +108,7 @@ class BrowsyTypeTextTool(BaseTool):
     args_schema: Type[BaseModel] = TypeTextInput
 
     def _run(self, element_id: int, text: str) -> str:
-        _browser.type_text(element_id, text)
+        _get_browser().type_text(element_id, text)
         return f"Typed '{text}' into element {element_id}"
 
 
@@ -115,7 +123,7 @@ class BrowsySearchTool(BaseTool):
     args_schema: Type[BaseModel] = SearchInput
 
     def _run(self, query: str) -> str:
-        results = _browser.search(query)
+        results = _get_browser().search(query)
         lines = []
         for i, r in enumerate(results, 1):
             lines.append(f"{i}. {r['title']}")
@@ -138,10 +146,8 @@ class BrowsyLoginTool(BaseTool):
     args_schema: Type[BaseModel] = LoginInput
 
     def _run(self, username: str, password: str) -> str:
-        page = _browser.login(username, password)
-        result = f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type}\n"
-        result += f"---\n{page.to_compact()}"
-        return result
+        page = _get_browser().login(username, password)
+        return f"{_page_header(page)}\n---\n{page.to_compact()}"
 
 
 class BrowsyPageInfoTool(BaseTool):
@@ -155,13 +161,13 @@ class BrowsyPageInfoTool(BaseTool):
     )
 
     def _run(self) -> str:
-        page = _browser.dom()
+        page = _get_browser().dom()
         if page is None:
             return "No page loaded. Use browsy_browse first."
 
         result = f"title: {page.title}\n"
         result += f"url: {page.url}\n"
-        result += f"page_type: {page.page_type}\n"
+        result += f"page_type: {page.page_type()}\n"
 
         actions = page.suggested_actions()
         if actions:
@@ -18,175 +18,209 @@ import json
 from browsy import Browser
 
 
-_browser = Browser()
-
-
-def get_browsy_tool_definitions():
-    """Return OpenAI-compatible tool definitions for browsy."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_browse",
-                "description": (
-                    "Navigate to a URL and return page content with page intelligence. "
-                    "Returns page type (Login, Search, Form, etc.), suggested actions "
-                    "with element IDs, and all interactive elements."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to navigate to",
-                        }
-                    },
-                    "required": ["url"],
+_browser = None
+
+
+def _get_browser(explicit=None):
+    """Return ``explicit`` if given, else a shared Browser created on first use."""
+    global _browser
+    if explicit is not None:
+        return explicit
+    if _browser is None:
+        _browser = Browser()
+    return _browser
+
+
+# Built once at import; the schema never changes between calls.
+_TOOL_DEFS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_browse",
+            "description": (
+                "Navigate to a URL and return page content with page intelligence. "
+                "Returns page type (Login, Search, Form, etc.), suggested actions "
+                "with element IDs, and all interactive elements."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "URL to navigate to",
+                    }
                 },
+                "required": ["url"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_click",
-                "description": "Click an element by its ID. Links navigate, buttons submit forms.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "element_id": {
-                            "type": "integer",
-                            "description": "Element ID to click",
-                        }
-                    },
-                    "required": ["element_id"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_click",
+            "description": "Click an element by its ID. Links navigate, buttons submit forms.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "element_id": {
+                        "type": "integer",
+                        "description": "Element ID to click",
+                    }
                 },
+                "required": ["element_id"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_type_text",
-                "description": "Type text into an input field or textarea by element ID.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "element_id": {
-                            "type": "integer",
-                            "description": "Element ID of the text input",
-                        },
-                        "text": {
-                            "type": "string",
-                            "description": "Text to type into the input",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_type_text",
+            "description": "Type text into an input field or textarea by element ID.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "element_id": {
+                        "type": "integer",
+                        "description": "Element ID of the text input",
+                    },
+                    "text": {
+                        "type": "string",
+                        "description": "Text to type into the input",
                     },
-                    "required": ["element_id", "text"],
                 },
+                "required": ["element_id", "text"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_search",
-                "description": "Search the web and return structured results with title, URL, and snippet.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query",
-                        }
-                    },
-                    "required": ["query"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_search",
+            "description": "Search the web and return structured results with title, URL, and snippet.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Search query",
+                    }
                 },
+                "required": ["query"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_login",
-                "description": "Log in using detected login form fields on the current page.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "username": {
-                            "type": "string",
-                            "description": "Username or email",
-                        },
-                        "password": {
-                            "type": "string",
-                            "description": "Password",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_login",
+            "description": "Log in using detected login form fields on the current page.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "username": {
+                        "type": "string",
+                        "description": "Username or email",
+                    },
+                    "password": {
+                        "type": "string",
+                        "description": "Password",
                     },
-                    "required": ["username", "password"],
                 },
+                "required": ["username", "password"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "browsy_page_info",
-                "description": "Get current page metadata: type, suggested actions, alerts.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "browsy_page_info",
+            "description": "Get current page metadata: type, suggested actions, alerts.",
+            "parameters": {
+                "type": "object",
+                "properties": {},
             },
         },
-    ]
-
-
-def handle_tool_call(function_name: str, arguments: dict) -> str:
-    """Handle a tool call from the OpenAI API and return the result string."""
-
-    if function_name == "browsy_browse":
-        page = _browser.goto(arguments["url"])
-        return _format_page(page)
-
-    elif function_name == "browsy_click":
-        page = _browser.click(arguments["element_id"])
-        return _format_page(page)
-
-    elif function_name == "browsy_type_text":
-        _browser.type_text(arguments["element_id"], arguments["text"])
-        return f"Typed '{arguments['text']}' into element {arguments['element_id']}"
-
-    elif function_name == "browsy_search":
-        results = _browser.search(arguments["query"])
-        lines = []
-        for i, r in enumerate(results, 1):
-            lines.append(f"{i}. {r['title']}")
-            lines.append(f"   {r['url']}")
-            if r.get("snippet"):
-                lines.append(f"   {r['snippet']}")
-            lines.append("")
-        return "\n".join(lines) if lines else "No results found."
-
-    elif function_name == "browsy_login":
-        page = _browser.login(arguments["username"], arguments["password"])
-        return _format_page(page)
-
-    elif function_name == "browsy_page_info":
-        page = _browser.dom()
-        if page is None:
-            return "No page loaded."
-        result = f"page_type: {page.page_type}\n"
-        actions = page.suggested_actions()
-        if actions:
-            for a in actions:
-                result += f"  {a}\n"
-        return result
-
-    else:
-        return f"Unknown function: {function_name}"
+    },
+]
 
 
-def _format_page(page) -> str:
-    result = f"title: {page.title}\nurl: {page.url}\n"
-    result += f"page_type: {page.page_type}\n"
+def get_browsy_tool_definitions():
+    """Return OpenAI-compatible tool definitions for browsy.
+
+    The returned list is shared; copy it before mutating.
+    """
+    return _TOOL_DEFS
+
+
+def _browse(b, arguments):
+    return _format_page(b.goto(arguments["url"]))
+
+
+def _click(b, arguments):
+    return _format_page(b.click(arguments["element_id"]))
+
+
+def _type_text(b, arguments):
+    b.type_text(arguments["element_id"], arguments["text"])
+    return f"Typed '{arguments['text']}' into element {arguments['element_id']}"
+
+
+def _search(b, arguments):
+    results = b.search(arguments["query"])
+    lines = []
+    for i, r in enumerate(results, 1):
+        lines.append(f"{i}. {r['title']}")
+        lines.append(f"   {r['url']}")
+        if r.get("snippet"):
+            lines.append(f"   {r['snippet']}")
+        lines.append("")
+    return "\n".join(lines) if lines else "No results found."
+
+
+def _login(b, arguments):
+    return _format_page(b.login(arguments["username"], arguments["password"]))
+
+
+def _page_info(b, arguments):
+    page = b.dom()
+    if page is None:
+        return "No page loaded."
+    result = f"page_type: {page.page_type()}\n"
     actions = page.suggested_actions()
     if actions:
-        result += "suggested_actions:\n"
         for a in actions:
             result += f"  {a}\n"
-    result += f"---\n{page.to_compact()}"
     return result
+
+
+_HANDLERS = {
+    "browsy_browse": _browse,
+    "browsy_click": _click,
+    "browsy_type_text": _type_text,
+    "browsy_search": _search,
+    "browsy_login": _login,
+    "browsy_page_info": _page_info,
+}
+
+
+def handle_tool_call(function_name: str, arguments: dict, browser=None) -> str:
+    """Handle a tool call from the OpenAI API and return the result string.
+
+    Args:
+        browser: Optional Browser instance. If None, a shared default is used.
+    """
+    handler = _HANDLERS.get(function_name)
+    if handler is None:
+        return f"Unknown function: {function_name}"
+    return handler(_get_browser(browser), arguments)
+
+
+def _format_page(page) -> str:
+    parts = [f"title: {page.title}\nurl: {page.url}\npage_type: {page.page_type()}"]
+    actions = page.suggested_actions()
+    if actions:
+        parts.append("suggested_actions:")
+        parts.extend(f"  {a}" for a in actions)
+    parts.append("---")
+    parts.append(page.to_compact())
+    return "\n".join(parts)